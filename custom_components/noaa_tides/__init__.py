@@ -1,32 +1,32 @@
 """The noaa_tides component."""
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
+from .const import (
+    CONF_STATION_ID,
+    CONF_STATION_TYPE,
+    DEFAULT_TIMEZONE,
+    DOMAIN,
+    UNIT_SYSTEMS,
+)
+from .stations import async_schedule_station_prewarm
+
 _LOGGER = logging.getLogger(__name__)
 
-DOMAIN = "noaa_tides"
 PLATFORMS = [Platform.SENSOR]
 
-CONF_STATION_ID = "station_id"
-CONF_STATION_TYPE = "type"
-
-DEFAULT_TIMEZONE = "lst_ldt"
-UNIT_SYSTEMS = ["english", "metric"]
-
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up NOAA Tides from a config entry."""
-    from .sensor import (
-        NOAATidesDataUpdateCoordinator,
-        NOAATemperatureDataUpdateCoordinator,
-        NOAABuoyDataUpdateCoordinator,
-    )
+    from .sensor import COORDINATORS
 
     hass.data.setdefault(DOMAIN, {})
     
@@ -42,29 +42,36 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         unit_system = UNIT_SYSTEMS[0]  # "english"
     
     # Create appropriate coordinator based on station type
-    if station_type == "tides":
-        coordinator = NOAATidesDataUpdateCoordinator(
-            hass, station_id, timezone, unit_system
-        )
-    elif station_type == "temp":
-        coordinator = NOAATemperatureDataUpdateCoordinator(
-            hass, station_id, timezone, unit_system
-        )
-    else:  # buoy
-        coordinator = NOAABuoyDataUpdateCoordinator(
-            hass, station_id, timezone, unit_system
-        )
-    
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    coordinator_class = COORDINATORS.get(station_type)
+    if coordinator_class is None:
+        raise ConfigEntryNotReady(f"Unknown station type: {station_type}")
+    coordinator = coordinator_class(hass, station_id, timezone, unit_system)
     
-    # Store coordinator
+    # Store coordinator before forwarding so the platforms can find it
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Overlap the initial fetch with platform setup; the entities read
+    # coordinator.data lazily and handle it being None until it arrives
+    refresh_result, forward_result = await asyncio.gather(
+        coordinator.async_config_entry_first_refresh(),
+        hass.config_entries.async_forward_entry_setups(entry, PLATFORMS),
+        return_exceptions=True,
+    )
+    if isinstance(forward_result, BaseException):
+        hass.data[DOMAIN].pop(entry.entry_id)
+        raise forward_result
+    if isinstance(refresh_result, BaseException):
+        # Undo the platform setup so the retry starts from a clean slate
+        await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+        hass.data[DOMAIN].pop(entry.entry_id)
+        raise refresh_result
 
     entry.async_on_unload(entry.add_update_listener(async_update_options))
 
+    # Warm the station lists so a later config flow doesn't wait on NOAA;
+    # runs in the background, so neither entry setup nor startup waits on it
+    async_schedule_station_prewarm(hass)
+
     return True
 
 
@@ -1,11 +1,12 @@
 """Config flow for NOAA Tides integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
+from urllib.parse import quote
 
-import noaa_coops as nc
-import requests
+import aiohttp
 import voluptuous as vol
 
 from homeassistant import config_entries
@@ -13,28 +14,50 @@ from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv
-
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    CONF_ENTRY_METHOD,
+    CONF_STATE,
+    CONF_STATION_ID,
+    CONF_STATION_TYPE,
+    DEFAULT_NAME,
+    DOMAIN,
+    ENTRY_METHODS,
+    STATION_TYPES,
+)
 from .stations import (
+    NOAA_STATION_URL,
+    Station,
+    fetch_noaa_station_options,
     fetch_noaa_stations,
-    get_states_from_stations,
-    filter_stations_by_state,
-    get_station_options,
+    fetch_noaa_stations_in_state,
+    fetch_noaa_states,
+    get_cached_station_index,
+    verify_buoy_id,
     verify_station_id,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-CONF_STATION_ID = "station_id"
-CONF_STATION_TYPE = "type"
-CONF_STATE = "state"
-CONF_ENTRY_METHOD = "entry_method"
+# Station types served by the NOAA CO-OPS API (buoys come from NDBC)
+_TIDES_OR_TEMP = frozenset(("tides", "temp"))
 
-DOMAIN = "noaa_tides"
+# Errors that mean the station could not be validated against NOAA
+_VALIDATION_ERRORS = (ValueError, aiohttp.ClientError, asyncio.TimeoutError)
 
-DEFAULT_NAME = "NOAA Tides"
-
-STATION_TYPES = ["tides", "temp", "buoy"]
-ENTRY_METHODS = ["lookup", "manual"]
+# Schemas that don't depend on runtime data are built once at import
+USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_STATION_TYPE, default="tides"): vol.In(STATION_TYPES),
+        vol.Required(CONF_ENTRY_METHOD, default="lookup"): vol.In(ENTRY_METHODS),
+    }
+)
+MANUAL_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_STATION_ID): str,
+    }
+)
 
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
@@ -45,18 +68,42 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     station_id = data[CONF_STATION_ID]
     station_type = data[CONF_STATION_TYPE]
 
-    # For tides and temp types, validate station exists via noaa_coops
-    if station_type in ["tides", "temp"]:
+    # For tides and temp types, accept IDs already in a cached station list
+    # and only ask the NOAA metadata API about the rest; never download a
+    # whole list just to validate one ID
+    if station_type in _TIDES_OR_TEMP and not _station_is_cached(hass, station_id):
+        session = async_get_clientsession(hass)
         try:
-            await hass.async_add_executor_job(nc.Station, station_id)
-        except (ValueError, requests.exceptions.ConnectionError) as err:
+            async with session.get(
+                # Escape the free-text ID so it can't change the URL path or query
+                NOAA_STATION_URL.format(station_id=quote(station_id, safe="")),
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as response:
+                if response.status != 200:
+                    raise ValueError(f"HTTP {response.status}")
+        except _VALIDATION_ERRORS as err:
             _LOGGER.error("Failed to validate station %s: %s", station_id, err)
-            raise ValueError("cannot_connect")
-    # For buoy type, just ensure the station_id is provided
+            raise ValueError("cannot_connect") from err
+    # For buoy type, only check the ID format
     # API validation happens at runtime since buoy API can be slow
+    elif station_type == "buoy":
+        is_valid, message = verify_buoy_id(station_id)
+        if not is_valid:
+            raise ValueError(message)
 
     # Return info that you want to store in the config entry.
-    return {"title": data.get(CONF_NAME, f"{DEFAULT_NAME} {station_id}")}
+    # Only format the fallback title when no name was given
+    title = data[CONF_NAME] if CONF_NAME in data else f"{DEFAULT_NAME} {station_id}"
+    return {"title": title}
+
+
+@callback
+def _station_is_cached(hass: HomeAssistant, station_id: str) -> bool:
+    """Return True if the station ID is in an already cached NOAA station list."""
+    return (
+        station_id in get_cached_station_index(hass, "tidepredictions")
+        or station_id in get_cached_station_index(hass, "waterlevels")
+    )
 
 
 class NOAATidesConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -67,8 +114,11 @@ class NOAATidesConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize config flow."""
         self.config_data: dict[str, Any] = {}
-        self.stations_cache: list[dict[str, Any]] = []
         self.station_name: str | None = None
+        # Stations in the selected state and their selector options, looked
+        # up from the cached station view once when the state is chosen
+        self._state_stations: list[Station] = []
+        self._station_options: dict[str, str] = {}
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -87,40 +137,43 @@ class NOAATidesConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 # For tides/temp with lookup, go to state selection
                 return await self.async_step_state()
 
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_STATION_TYPE, default="tides"): vol.In(STATION_TYPES),
-                vol.Required(CONF_ENTRY_METHOD, default="lookup"): vol.In(ENTRY_METHODS),
-            }
-        )
-
         return self.async_show_form(
-            step_id="user", data_schema=data_schema, errors=errors
+            step_id="user", data_schema=USER_DATA_SCHEMA, errors=errors
         )
 
+    @property
+    def _api_type(self) -> str:
+        """Return the NOAA metadata API station type for the chosen station type."""
+        if self.config_data[CONF_STATION_TYPE] == "tides":
+            return "tidepredictions"
+        return "waterlevels"
+
     async def async_step_state(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle state selection step."""
         errors: dict[str, str] = {}
 
-        # Fetch stations if not already cached
-        if not self.stations_cache:
-            station_type = self.config_data[CONF_STATION_TYPE]
-            api_type = "tidepredictions" if station_type == "tides" else "waterlevels"
-            self.stations_cache = await fetch_noaa_stations(self.hass, api_type)
-            
-            if not self.stations_cache:
-                # If we can't fetch stations, fall back to manual entry
-                _LOGGER.warning("Could not fetch station list, falling back to manual entry")
-                return await self.async_step_manual()
+        # Stations are cached on hass.data and shared between config flows
+        stations = await fetch_noaa_stations(self.hass, self._api_type)
+        
+        if not stations:
+            # If we can't fetch stations, fall back to manual entry
+            _LOGGER.warning("Could not fetch station list, falling back to manual entry")
+            return await self.async_step_manual()
 
         if user_input is not None:
             self.config_data[CONF_STATE] = user_input[CONF_STATE]
+            self._state_stations = await fetch_noaa_stations_in_state(
+                self.hass, self._api_type, user_input[CONF_STATE]
+            )
+            self._station_options = await fetch_noaa_station_options(
+                self.hass, self._api_type, user_input[CONF_STATE]
+            )
             return await self.async_step_station()
 
-        # Get list of states
-        states = get_states_from_stations(self.stations_cache)
+        # Get list of states (precomputed alongside the cached station list)
+        states = await fetch_noaa_states(self.hass, self._api_type)
         
         if not states:
             # No states found, fall back to manual entry
@@ -147,27 +200,21 @@ class NOAATidesConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             
             # Look up and store the station name
             station_id = user_input[CONF_STATION_ID]
-            for station in self.stations_cache:
-                if station.get("id") == station_id:
-                    self.station_name = station.get("name", "Unknown")
+            for state_station_id, station_name, _ in self._state_stations:
+                if state_station_id == station_id:
+                    self.station_name = station_name
                     break
             
             return await self.async_step_name()
 
-        # Filter stations by selected state
-        state = self.config_data[CONF_STATE]
-        filtered_stations = filter_stations_by_state(self.stations_cache, state)
-        
-        if not filtered_stations:
+        # Station options were built once when the state was selected
+        if not self._station_options:
             errors["base"] = "no_stations_in_state"
             return await self.async_step_manual()
 
-        # Get station options
-        station_options = get_station_options(filtered_stations)
-
         data_schema = vol.Schema(
             {
-                vol.Required(CONF_STATION_ID): vol.In(station_options),
+                vol.Required(CONF_STATION_ID): vol.In(self._station_options),
             }
         )
 
@@ -185,8 +232,11 @@ class NOAATidesConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             station_id = user_input[CONF_STATION_ID]
             station_type = self.config_data[CONF_STATION_TYPE]
             
-            # Verify the station ID instantly
-            is_valid, message = await verify_station_id(self.hass, station_id, station_type)
+            # Verify the station ID instantly; buoy IDs are a format check only
+            if station_type == "buoy":
+                is_valid, message = verify_buoy_id(station_id)
+            else:
+                is_valid, message = await verify_station_id(self.hass, station_id, station_type)
             
             if not is_valid:
                 errors["base"] = "invalid_station_id"
@@ -197,14 +247,8 @@ class NOAATidesConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 self.station_name = message
                 return await self.async_step_name()
 
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_STATION_ID): str,
-            }
-        )
-
         return self.async_show_form(
-            step_id="manual", data_schema=data_schema, errors=errors
+            step_id="manual", data_schema=MANUAL_DATA_SCHEMA, errors=errors
         )
 
     async def async_step_name(
@@ -227,25 +271,11 @@ class NOAATidesConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 info = await validate_input(self.hass, self.config_data)
             except ValueError:
                 errors["base"] = "cannot_connect"
-                default_name = self.station_name if self.station_name else DEFAULT_NAME
-                return self.async_show_form(
-                    step_id="name", 
-                    data_schema=vol.Schema({
-                        vol.Optional(CONF_NAME, default=default_name): str,
-                    }),
-                    errors=errors
-                )
+                return self._async_show_name_form(errors)
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
-                default_name = self.station_name if self.station_name else DEFAULT_NAME
-                return self.async_show_form(
-                    step_id="name", 
-                    data_schema=vol.Schema({
-                        vol.Optional(CONF_NAME, default=default_name): str,
-                    }),
-                    errors=errors
-                )
+                return self._async_show_name_form(errors)
 
             # Set unique_id based on station_id and type to prevent duplicates
             await self.async_set_unique_id(
@@ -262,9 +292,14 @@ class NOAATidesConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             return self.async_create_entry(title=info["title"], data=final_data)
 
+        return self._async_show_name_form(errors)
+
+    @callback
+    def _async_show_name_form(self, errors: dict[str, str]) -> FlowResult:
+        """Show the name form, defaulting to the station name when known."""
         # Use station name as default if available, otherwise use DEFAULT_NAME
         default_name = self.station_name if self.station_name else DEFAULT_NAME
-        
+
         data_schema = vol.Schema(
             {
                 vol.Optional(CONF_NAME, default=default_name): str,
@@ -0,0 +1,21 @@
+"""Constants for the NOAA Tides integration."""
+from __future__ import annotations
+
+DOMAIN = "noaa_tides"
+
+CONF_STATION_ID = "station_id"
+CONF_STATION_TYPE = "type"
+CONF_STATE = "state"
+CONF_ENTRY_METHOD = "entry_method"
+
+DEFAULT_NAME = "NOAA Tides"
+DEFAULT_TIMEZONE = "lst_ldt"
+DEFAULT_ATTRIBUTION = "Data provided by NOAA"
+BUOY_ATTRIBUTION = "Data provided by NDBC"
+
+# Tuples rather than sets: vol.In keeps this order for the form dropdowns,
+# and UNIT_SYSTEMS is indexed
+STATION_TYPES = ("tides", "temp", "buoy")
+ENTRY_METHODS = ("lookup", "manual")
+TIMEZONES = ("gmt", "lst", "lst_ldt")
+UNIT_SYSTEMS = ("english", "metric")
@@ -1,14 +1,20 @@
 """Support for the NOAA Tides and Currents API."""
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from datetime import timezone as tz
+from functools import lru_cache
 import logging
 import requests
 import math
+import re
 from typing import Any, Optional
 
+import aiohttp
 import noaa_coops as nc
+import pandas as pd
 import voluptuous as vol
 
 from homeassistant.components.sensor import PLATFORM_SCHEMA, SensorEntity, SensorStateClass
@@ -22,6 +28,7 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -33,24 +40,34 @@ from homeassistant.helpers.update_coordinator import (
 from homeassistant.util.unit_system import METRIC_SYSTEM
 from homeassistant.components.sensor import SensorDeviceClass
 
-_LOGGER = logging.getLogger(__name__)
-
-DOMAIN = "noaa_tides"
-
-CONF_STATION_ID = "station_id"
-CONF_STATION_TYPE = "type"
+from .const import (
+    BUOY_ATTRIBUTION,
+    CONF_STATION_ID,
+    CONF_STATION_TYPE,
+    DEFAULT_ATTRIBUTION,
+    DEFAULT_NAME,
+    DEFAULT_TIMEZONE,
+    DOMAIN,
+    STATION_TYPES,
+    TIMEZONES,
+    UNIT_SYSTEMS,
+)
 
-DEFAULT_ATTRIBUTION = "Data provided by NOAA"
-BUOY_ATTRIBUTION = "Data provided by NDBC"
-DEFAULT_NAME = "NOAA Tides"
-DEFAULT_TIMEZONE = "lst_ldt"
+_LOGGER = logging.getLogger(__name__)
 
 # Time window for fetching current water level observations (in hours)
 WATER_LEVEL_LOOKBACK_HOURS = 1
 
-TIMEZONES = ["gmt", "lst", "lst_ldt"]
-UNIT_SYSTEMS = ["english", "metric"]
-STATION_TYPES = ["tides", "temp", "buoy"]
+# How far ahead tide predictions are fetched and cached (in days)
+PREDICTIONS_CACHE_DAYS = 7
+
+# Date formats: NOAA CO-OPS API requests, ISO attributes, and tide display
+_FMT_API = "%Y%m%d %H:%M"
+_FMT_ISO = "%Y-%m-%dT%H:%M"
+_FMT_DISPLAY = "%-I:%M %p"
+
+# Measurement columns kept as float32 in cached coordinator data
+_FLOAT32_COLUMNS = ("predicted_wl", "water_level", "water_temp", "air_temp")
 
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
@@ -63,6 +80,64 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
 )
 
 
+def _downcast(df):
+    """Return the frame with its NOAA measurement columns stored as float32."""
+    columns = {column: "float32" for column in _FLOAT32_COLUMNS if column in df.columns}
+    return df.astype(columns) if columns else df
+
+
+def _as_float(value) -> float:
+    """Convert a float32 measurement back to a plain, JSON-safe float."""
+    return round(float(value), 3)
+
+
+def _fmt(value: datetime, fmt: str) -> str:
+    """Format a timestamp for display, memoized across state reads."""
+    # tzinfo is part of the key: aware timestamps for the same instant in
+    # different zones compare equal but format differently
+    return _fmt_cached(value, value.tzinfo, fmt)
+
+
+@lru_cache(maxsize=256)
+def _fmt_cached(value: datetime, tzinfo, fmt: str) -> str:
+    """Format a timestamp; see _fmt."""
+    return value.strftime(fmt)
+
+
+@lru_cache(maxsize=64)
+def _get_station(station_id: str) -> nc.Station:
+    """Return the noaa_coops station object for a station ID."""
+    return nc.Station(station_id)
+
+
+def _now_like(like) -> pd.Timestamp:
+    """Return the current time in the timezone of a DatetimeIndex or Timestamp."""
+    return pd.Timestamp.now(tz=like.tz)
+
+
+def _next_tide_position(index: pd.DatetimeIndex) -> int:
+    """Return the position of the first predicted tide after now."""
+    return index.searchsorted(_now_like(index), side="right")
+
+
+@dataclass(frozen=True)
+class TidesResult:
+    """Data produced by one NOAATidesDataUpdateCoordinator update."""
+
+    predictions: Any
+    prediction_hi_lo: Any
+    prediction_levels: Any
+    current_water_level: Any
+
+
+@dataclass(frozen=True)
+class TemperatureResult:
+    """Latest (value, ISO time) readings from one temperature update."""
+
+    water_temp: tuple[float, str] | None
+    air_temp: tuple[float, str] | None
+
+
 class NOAATidesDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching NOAA Tides data from the API."""
 
@@ -78,6 +153,10 @@ class NOAATidesDataUpdateCoordinator(DataUpdateCoordinator):
         self.timezone = timezone
         self.unit_system = unit_system
         self.station: nc.Station | None = None
+        # Predictions are deterministic, so a multi-day frame is reused
+        # across updates until its end gets close
+        self._predictions_cache = None
+        self._predictions_cache_end: datetime | None = None
 
         super().__init__(
             hass,
@@ -86,23 +165,51 @@ class NOAATidesDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(hours=1),
         )
 
-    async def _async_update_data(self) -> Any:
+    async def _async_update_data(self) -> TidesResult:
         """Fetch data from NOAA Tides API."""
+        # One anchor for both windows so they can't drift apart
+        now = datetime.now()
         try:
-            return await self.hass.async_add_executor_job(self._fetch_data)
+            if self.station is None:
+                await self.hass.async_add_executor_job(self._create_station)
+            # The two products are independent requests, so run them concurrently
+            df_predictions, current_water_level = await asyncio.gather(
+                self.hass.async_add_executor_job(self._fetch_predictions, now),
+                self.hass.async_add_executor_job(self._fetch_water_level, now),
+            )
         except (ValueError, requests.exceptions.ConnectionError) as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
-    def _fetch_data(self) -> dict[str, Any]:
-        """Fetch the tide predictions data and current water level."""
-        if self.station is None:
-            _LOGGER.debug("No station object exists yet- creating one.")
-            self.station = nc.Station(self.station_id)
+        # Pull the two columns the sensors read out as plain arrays once per
+        # update, so state reads index them instead of boxing a row Series
+        hi_lo = df_predictions["hi_lo"].to_numpy()
+        levels = df_predictions["predicted_wl"].to_numpy()
 
-        begin = datetime.now() - timedelta(hours=24)
-        begin_date = begin.strftime("%Y%m%d %H:%M")
-        end = begin + timedelta(hours=48)
-        end_date = end.strftime("%Y%m%d %H:%M")
+        return TidesResult(
+            predictions=df_predictions,
+            prediction_hi_lo=hi_lo,
+            prediction_levels=levels,
+            current_water_level=current_water_level,
+        )
+
+    def _create_station(self) -> None:
+        """Create the noaa_coops station object."""
+        _LOGGER.debug("No station object exists yet- creating one.")
+        self.station = _get_station(self.station_id)
+
+    def _fetch_predictions(self, now: datetime) -> Any:
+        """Fetch the hi/lo tide predictions from 24 hours before now onwards."""
+        if (
+            self._predictions_cache is not None
+            and self._predictions_cache_end - now > timedelta(hours=24)
+        ):
+            _LOGGER.debug("Using cached tide predictions")
+            cache_now = _now_like(self._predictions_cache.index)
+            return self._predictions_cache.loc[cache_now - timedelta(hours=24):]
+
+        end = now + timedelta(days=PREDICTIONS_CACHE_DAYS)
+        begin_date = (now - timedelta(hours=24)).strftime(_FMT_API)
+        end_date = end.strftime(_FMT_API)
 
         df_predictions = self.station.get_data(
             begin_date=begin_date,
@@ -115,34 +222,33 @@ class NOAATidesDataUpdateCoordinator(DataUpdateCoordinator):
         )
 
         _LOGGER.debug("Tide data queried with start time set to %s", begin_date)
-        
-        # Fetch current water level data
-        current_water_level = None
+        df_predictions = _downcast(df_predictions)
+        self._predictions_cache = df_predictions
+        self._predictions_cache_end = end
+        return df_predictions
+
+    def _fetch_water_level(self, now: datetime) -> Any:
+        """Fetch the recent water level observations, or None if unavailable."""
         try:
-            current_end = datetime.now()
-            current_begin = current_end - timedelta(hours=WATER_LEVEL_LOOKBACK_HOURS)
+            current_begin = now - timedelta(hours=WATER_LEVEL_LOOKBACK_HOURS)
             df_water_level = self.station.get_data(
-                begin_date=current_begin.strftime("%Y%m%d %H:%M"),
-                end_date=current_end.strftime("%Y%m%d %H:%M"),
+                begin_date=current_begin.strftime(_FMT_API),
+                end_date=now.strftime(_FMT_API),
                 product="water_level",
                 datum="MLLW",
                 units=self.unit_system,
                 time_zone=self.timezone,
             )
-            current_water_level = df_water_level
             _LOGGER.debug(
                 "Current water level data retrieved: %d records",
                 len(df_water_level) if df_water_level is not None else 0,
             )
+            return _downcast(df_water_level) if df_water_level is not None else None
         except ValueError as err:
             _LOGGER.debug("Could not fetch current water level data: %s", err.args)
         except requests.exceptions.ConnectionError as err:
             _LOGGER.debug("Couldn't connect to NOAA Tides and Currents API for water level: %s", err)
-        
-        return {
-            "predictions": df_predictions,
-            "current_water_level": current_water_level,
-        }
+        return None
 
 
 class NOAATemperatureDataUpdateCoordinator(DataUpdateCoordinator):
@@ -168,56 +274,109 @@ class NOAATemperatureDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(minutes=30),
         )
 
-    async def _async_update_data(self) -> Any:
+    async def _async_update_data(self) -> TemperatureResult:
         """Fetch data from NOAA Temperature API."""
+        end = datetime.now()
+        delta = timedelta(minutes=60)
+        begin = end - delta
+        # Both products share the same window, so format it once
+        begin_date = begin.strftime(_FMT_API)
+        end_date = end.strftime(_FMT_API)
         try:
-            return await self.hass.async_add_executor_job(self._fetch_data)
+            if self.station is None:
+                await self.hass.async_add_executor_job(self._create_station)
+            # Water and air temperature are independent requests, so run them concurrently
+            temps, air_temps = await asyncio.gather(
+                self.hass.async_add_executor_job(
+                    self._fetch_latest, "water_temperature", "water_temp", begin_date, end_date
+                ),
+                self.hass.async_add_executor_job(
+                    self._fetch_latest, "air_temperature", "air_temp", begin_date, end_date
+                ),
+            )
         except (ValueError, requests.exceptions.ConnectionError) as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
-    def _fetch_data(self) -> tuple[Any, Any]:
-        """Fetch the temperature data."""
-        if self.station is None:
-            _LOGGER.debug("No station object exists yet- creating one.")
-            self.station = nc.Station(self.station_id)
+        return TemperatureResult(water_temp=temps, air_temp=air_temps)
 
-        end = datetime.now()
-        delta = timedelta(minutes=60)
-        begin = end - delta
-        temps = None
-        air_temps = None
+    def _create_station(self) -> None:
+        """Create the noaa_coops station object."""
+        _LOGGER.debug("No station object exists yet- creating one.")
+        self.station = _get_station(self.station_id)
 
+    def _fetch_latest(
+        self, product: str, column: str, begin_date: str, end_date: str
+    ) -> tuple[float, str] | None:
+        """Fetch the most recent reading of a temperature product."""
         try:
-            temps = self.station.get_data(
-                begin_date=begin.strftime("%Y%m%d %H:%M"),
-                end_date=end.strftime("%Y%m%d %H:%M"),
-                product="water_temperature",
+            df = self.station.get_data(
+                begin_date=begin_date,
+                end_date=end_date,
+                product=product,
                 units=self.unit_system,
                 time_zone=self.timezone,
-            ).tail(1)
-            _LOGGER.debug(
-                "Recent water temperature data queried with start time set to %s",
-                begin.strftime("%m-%d-%Y %H:%M"),
             )
-        except ValueError as err:
-            _LOGGER.error("Check NOAA Tides and Currents: %s", err.args)
-
-        try:
-            air_temps = self.station.get_data(
-                begin_date=begin.strftime("%Y%m%d %H:%M"),
-                end_date=end.strftime("%Y%m%d %H:%M"),
-                product="air_temperature",
-                units=self.unit_system,
-                time_zone=self.timezone,
-            ).tail(1)
             _LOGGER.debug(
-                "Recent temperature data queried with start time set to %s",
-                begin.strftime("%m-%d-%Y %H:%M"),
+                "Recent %s data queried with start time set to %s",
+                product,
+                begin_date,
             )
+            if df is None or df.empty:
+                return None
+            return _as_float(df[column].iloc[-1]), _fmt(df.index[-1], _FMT_ISO)
         except ValueError as err:
             _LOGGER.error("Check NOAA Tides and Currents: %s", err.args)
+        return None
+
+
+def _convert_buoy_value(value: str) -> Any:
+    """Convert one NDBC column value, keeping the "MM" missing-data marker."""
+    if value == "MM":
+        return value
+    if "." in value:
+        return float(value)
+    return int(value)
+
+
+# Buoy columns that make up the observation time rather than a reading
+_BUOY_TIME_FIELDS = frozenset(("YY", "MM", "DD", "hh", "mm"))
+
+# A header token: a run of anything but whitespace and the "#" comment marker
+_BUOY_TOKEN_RE = re.compile(r"[^#\s]+")
 
-        return (temps, air_temps)
+
+def _buoy_degc_to_degf(unit: str, value: Any) -> tuple[str, Any]:
+    """Return a (unit, value) buoy reading converted to degF if it is in degC."""
+    if unit != "degC" or value == "MM":
+        return unit, value
+    return "degF", round((value * 9 / 5) + 32, 1)
+
+
+def _parse_buoy_text(text: str, station_id: str) -> dict[str, Any]:
+    """Parse the latest observation from an NDBC realtime2 text file."""
+    # Only the two header lines and the newest observation are needed, so
+    # don't split the rest of the file
+    lines = text.split("\n", 3)[:3]
+    if len(lines) < 3:
+        _LOGGER.debug("Buoy response text: %s", text)
+        raise UpdateFailed(f"Received fewer than 3 lines of data from buoy {station_id}")
+
+    head = '\n    '.join(lines[0:3])
+    _LOGGER.debug("Buoy data head:\n    %s", head)
+    fields = _BUOY_TOKEN_RE.findall(lines[0])
+    units = _BUOY_TOKEN_RE.findall(lines[1])
+    values = lines[2].split()  # latest values are at the top of the file
+
+    data = {
+        field: (unit, _convert_buoy_value(value))
+        for field, unit, value in zip(fields, units, values)
+    }
+    # A blank or truncated data line (e.g. headers followed by a trailing
+    # newline) would otherwise leave the sensors without an observation time
+    if not _BUOY_TIME_FIELDS.issubset(data):
+        _LOGGER.debug("Buoy response text: %s", text)
+        raise UpdateFailed(f"Received no complete observation from buoy {station_id}")
+    return data
 
 
 class NOAABuoyDataUpdateCoordinator(DataUpdateCoordinator):
@@ -237,6 +396,7 @@ class NOAABuoyDataUpdateCoordinator(DataUpdateCoordinator):
         self.station_url = self.FMT_URI % station_id
         self.timezone = timezone
         self.unit_system = unit_system
+        self._last_modified: str | None = None
 
         super().__init__(
             hass,
@@ -247,40 +407,51 @@ class NOAABuoyDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from NOAA Buoy API."""
+        _LOGGER.debug("Querying the buoy database")
+        headers = {}
+        # NDBC only updates the file about once an hour, so most polls can be
+        # answered with 304 Not Modified and reuse the last parsed data
+        if self._last_modified is not None and self.data is not None:
+            headers["If-Modified-Since"] = self._last_modified
+
+        # Requested on the event loop through Home Assistant's pooled session
+        session = async_get_clientsession(self.hass)
         try:
-            return await self.hass.async_add_executor_job(self._fetch_data)
-        except requests.exceptions.RequestException as err:
+            async with session.get(
+                self.station_url,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as response:
+                if response.status == 304:
+                    _LOGGER.debug("Buoy data not modified since %s", self._last_modified)
+                    return self.data
+                response.raise_for_status()
+                text = await response.text()
+                last_modified = response.headers.get("Last-Modified")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
-    def _fetch_data(self) -> dict[str, Any]:
-        """Fetch the buoy data."""
-        _LOGGER.debug("Querying the buoy database")
-        r = requests.get(self.station_url, timeout=10)
-        r.raise_for_status()
-
-        lines = r.text.splitlines()
-        if len(lines) < 3:
-            _LOGGER.debug("Buoy response text: %s", r.text)
-            raise UpdateFailed(f"Received fewer than 3 lines of data from buoy {self.station_id}")
-
-        data = {}
-        head = '\n    '.join(lines[0:3])
-        _LOGGER.debug("Buoy data head:\n    %s", head)
-        fields = lines[0].strip("#").split()
-        units = lines[1].strip("#").split()
-        values = lines[2].split()  # latest values are at the top of the file
-
-        for i in range(len(fields)):
-            if values[i] == "MM":
-                data[fields[i]] = (units[i], values[i])
-            elif "." in values[i]:
-                data[fields[i]] = (units[i], float(values[i]))
-            else:
-                data[fields[i]] = (units[i], int(values[i]))
-
+        # The file is small and only the first three lines are parsed, so
+        # this stays on the event loop
+        data = _parse_buoy_text(text, self.station_id)
+        if self.unit_system == "english":
+            # Convert once per update rather than on every state read
+            data = {
+                field: _buoy_degc_to_degf(unit, value)
+                for field, (unit, value) in data.items()
+            }
+        self._last_modified = last_modified
         return data
 
 
+# Coordinator class for each station type
+COORDINATORS: dict[str, type[DataUpdateCoordinator]] = {
+    "tides": NOAATidesDataUpdateCoordinator,
+    "temp": NOAATemperatureDataUpdateCoordinator,
+    "buoy": NOAABuoyDataUpdateCoordinator,
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -320,7 +491,8 @@ async def async_setup_entry(
             coordinator, entry.entry_id, name, station_id, unit_system
         ))
 
-    async_add_entities(sensors, True)
+    # No update_before_add: the coordinator's first refresh is already running
+    async_add_entities(sensors)
 
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
@@ -342,18 +514,7 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
         unit_system = UNIT_SYSTEMS[0]
 
     # Create appropriate coordinator based on station type
-    if station_type == "tides":
-        coordinator = NOAATidesDataUpdateCoordinator(
-            hass, station_id, timezone, unit_system
-        )
-    elif station_type == "temp":
-        coordinator = NOAATemperatureDataUpdateCoordinator(
-            hass, station_id, timezone, unit_system
-        )
-    else:  # buoy
-        coordinator = NOAABuoyDataUpdateCoordinator(
-            hass, station_id, timezone, unit_system
-        )
+    coordinator = COORDINATORS[station_type](hass, station_id, timezone, unit_system)
     
     # Fetch initial data
     await coordinator.async_config_entry_first_refresh()
@@ -423,36 +584,30 @@ class NOAATidesAndCurrentsSensor(CoordinatorEntity, SensorEntity):
 
     def _extract_coordinator_data(self):
         """Extract predictions and current water level from coordinator data."""
-        coordinator_data = self.coordinator.data
-        if coordinator_data is None:
+        result = self.coordinator.data
+        if result is None:
             return None, None
-        
-        if isinstance(coordinator_data, dict):
-            predictions = coordinator_data.get("predictions")
-            current_water_level = coordinator_data.get("current_water_level")
-        else:
-            # Legacy data structure (just predictions)
-            predictions = coordinator_data
-            current_water_level = None
-        
-        return predictions, current_water_level
+        return result.predictions, result.current_water_level
+
+    def _prediction_columns(self):
+        """Return the hi/lo and predicted level columns as arrays."""
+        result = self.coordinator.data
+        return result.prediction_hi_lo, result.prediction_levels
 
-    def update_tide_factor_from_attr(self):
+    def _update_tide_factor(self, last_tide_dt, next_tide_dt, next_tide_type):
+        """Update the tide factor from the tides either side of now."""
         _LOGGER.debug("Updating sine fit for tide factor")
         if self.attr is None:
             return
-        if ("last_tide_time" not in self.attr or
-            "next_tide_time" not in self.attr or
-            "next_tide_type" not in self.attr):
+        now = _now_like(last_tide_dt)
+        predicted_period = (next_tide_dt - last_tide_dt).total_seconds()
+        if predicted_period <= 0:
             return
-        now = datetime.now()
-        most_recent = datetime.strptime(self.attr["last_tide_time"], "%I:%M %p")
-        next_tide_time = datetime.strptime(self.attr["next_tide_time"], "%I:%M %p")
-        predicted_period = (next_tide_time - most_recent).seconds
-        if self.attr["next_tide_type"] == "High":
-            self.attr["tide_factor"] = 50 - (50*math.cos((now - most_recent).seconds * math.pi / predicted_period))
+        elapsed = (now - last_tide_dt).total_seconds()
+        if next_tide_type == "High":
+            self.attr["tide_factor"] = 50 - (50*math.cos(elapsed * math.pi / predicted_period))
         else:
-            self.attr["tide_factor"] = 50 + (50*math.cos((now - most_recent).seconds * math.pi / predicted_period))
+            self.attr["tide_factor"] = 50 + (50*math.cos(elapsed * math.pi / predicted_period))
 
     @property
     def extra_state_attributes(self):
@@ -473,32 +628,36 @@ class NOAATidesAndCurrentsSensor(CoordinatorEntity, SensorEntity):
                 latest_observation = current_water_level_data.iloc[-1]
                 latest_time = current_water_level_data.index[-1]
                 # 'water_level' is the renamed column from NOAA API (originally 'v')
-                self.attr["current_water_level"] = latest_observation.water_level
-                self.attr["current_water_level_time"] = latest_time.strftime("%Y-%m-%dT%H:%M")
+                self.attr["current_water_level"] = _as_float(latest_observation.water_level)
+                self.attr["current_water_level_time"] = _fmt(latest_time, _FMT_ISO)
             except (IndexError, AttributeError) as err:
                 _LOGGER.debug("Could not extract current water level data: %s", err)
 
-        now = datetime.now()
-        tide_text = None
-        most_recent = None
-        for index, row in data.iterrows():
-            if most_recent is None or (index <= now and index > most_recent):
-                most_recent = index
-            elif index > now:
-                self.attr["next_tide_time"] = index.strftime("%-I:%M %p")
-                self.attr["last_tide_time"] = most_recent.strftime("%-I:%M %p")
-                tide_factor = 0
-                predicted_period = (index - most_recent).seconds
-                if row.hi_lo == "H":
-                    self.attr["next_tide_type"] = "High"
-                    self.attr["last_tide_type"] = "Low"
-                    self.attr["high_tide_level"] = row.predicted_wl
-                elif row.hi_lo == "L":
-                    self.attr["next_tide_type"] = "Low"
-                    self.attr["last_tide_type"] = "High"
-                    self.attr["low_tide_level"] = row.predicted_wl
-                self.update_tide_factor_from_attr()
-                return self.attr
+        pos = _next_tide_position(data.index)
+        # Need both a tide before now and one after it
+        if not 0 < pos < len(data):
+            return self.attr
+
+        hi_lo, levels = self._prediction_columns()
+        next_hi_lo = hi_lo[pos]
+        next_tide_type = "High" if next_hi_lo == "H" else "Low" if next_hi_lo == "L" else None
+        if next_tide_type is None:
+            # Missing or unknown tide type (e.g. a NaN row)
+            return self.attr
+
+        index = data.index[pos]
+        most_recent = data.index[pos - 1]
+        self.attr["next_tide_time"] = _fmt(index, _FMT_DISPLAY)
+        self.attr["last_tide_time"] = _fmt(most_recent, _FMT_DISPLAY)
+        self.attr["next_tide_type"] = next_tide_type
+        if next_tide_type == "High":
+            self.attr["last_tide_type"] = "Low"
+            self.attr["high_tide_level"] = _as_float(levels[pos])
+        else:
+            self.attr["last_tide_type"] = "High"
+            self.attr["low_tide_level"] = _as_float(levels[pos])
+        # Same window as the attributes above, so the two can't disagree
+        self._update_tide_factor(most_recent, index, next_tide_type)
         return self.attr
 
     @property
@@ -509,15 +668,18 @@ class NOAATidesAndCurrentsSensor(CoordinatorEntity, SensorEntity):
         if data is None:
             return None
             
-        now = datetime.now()
-        for index, row in data.iterrows():
-            if index > now:
-                if row.hi_lo == "H":
-                    next_tide = "High"
-                if row.hi_lo == "L":
-                    next_tide = "Low"
-                tide_time = index.strftime("%-I:%M %p")
-                return f"{next_tide} tide at {tide_time}"
+        pos = _next_tide_position(data.index)
+        if pos >= len(data):
+            return None
+
+        hi_lo, _ = self._prediction_columns()
+        next_hi_lo = hi_lo[pos]
+        next_tide = "High" if next_hi_lo == "H" else "Low" if next_hi_lo == "L" else None
+        if next_tide is None:
+            # Missing or unknown tide type (e.g. a NaN row)
+            return None
+        tide_time = _fmt(data.index[pos], _FMT_DISPLAY)
+        return f"{next_tide} tide at {tide_time}"
 
     def noaa_coops_update(self):
         _LOGGER.debug("update queried.")
@@ -525,16 +687,16 @@ class NOAATidesAndCurrentsSensor(CoordinatorEntity, SensorEntity):
         if self._station is None:
             _LOGGER.debug("No station object exists yet- creating one.")
             try:
-                self._station = nc.Station(self._station_id)
+                self._station = _get_station(self._station_id)
             except requests.exceptions.ConnectionError as err:
                 _LOGGER.error("Couldn't create a NOAA station object. Will retry next update. Error: %s", err)
                 self._station = None
                 return
 
         begin = datetime.now() - timedelta(hours=24)
-        begin_date = begin.strftime("%Y%m%d %H:%M")
+        begin_date = begin.strftime(_FMT_API)
         end = begin + timedelta(hours=48)
-        end_date = end.strftime("%Y%m%d %H:%M")
+        end_date = end.strftime(_FMT_API)
         try:
             df_predictions = self._station.get_data(
                 begin_date=begin_date,
@@ -562,8 +724,8 @@ class NOAATidesAndCurrentsSensor(CoordinatorEntity, SensorEntity):
             current_end = datetime.now()
             current_begin = current_end - timedelta(hours=WATER_LEVEL_LOOKBACK_HOURS)
             df_water_level = self._station.get_data(
-                begin_date=current_begin.strftime("%Y%m%d %H:%M"),
-                end_date=current_end.strftime("%Y%m%d %H:%M"),
+                begin_date=current_begin.strftime(_FMT_API),
+                end_date=current_end.strftime(_FMT_API),
                 product="water_level",
                 datum="MLLW",
                 units=self._unit_system,
@@ -573,7 +735,7 @@ class NOAATidesAndCurrentsSensor(CoordinatorEntity, SensorEntity):
             _LOGGER.debug(
                 "Current water level data retrieved: %d records, latest at %s",
                 len(df_water_level) if df_water_level is not None else 0,
-                current_end.strftime("%Y%m%d %H:%M"),
+                current_end.strftime(_FMT_API),
             )
         except ValueError as err:
             _LOGGER.debug("Could not fetch current water level data: %s", err.args)
@@ -624,14 +786,10 @@ class NOAACurrentWaterLevelSensor(CoordinatorEntity, SensorEntity):
 
     def _get_current_water_level_data(self):
         """Extract current water level data from coordinator."""
-        coordinator_data = self.coordinator.data
-        if coordinator_data is None:
+        result = self.coordinator.data
+        if result is None:
             return None
-        
-        if isinstance(coordinator_data, dict):
-            return coordinator_data.get("current_water_level")
-        
-        return None
+        return result.current_water_level
 
     @property
     def extra_state_attributes(self):
@@ -642,7 +800,7 @@ class NOAACurrentWaterLevelSensor(CoordinatorEntity, SensorEntity):
         if current_water_level_data is not None and not current_water_level_data.empty:
             try:
                 latest_time = current_water_level_data.index[-1]
-                attr["observation_time"] = latest_time.strftime("%Y-%m-%dT%H:%M")
+                attr["observation_time"] = _fmt(latest_time, _FMT_ISO)
             except (IndexError, AttributeError) as err:
                 _LOGGER.debug("Could not extract water level timestamp: %s", err)
         
@@ -660,7 +818,7 @@ class NOAACurrentWaterLevelSensor(CoordinatorEntity, SensorEntity):
             # Get the most recent water level observation
             latest_observation = current_water_level_data.iloc[-1]
             # 'water_level' is the renamed column from NOAA API (originally 'v')
-            return latest_observation.water_level
+            return _as_float(latest_observation.water_level)
         except (IndexError, AttributeError) as err:
             _LOGGER.debug("Could not extract current water level: %s", err)
             return None
@@ -711,12 +869,10 @@ class NOAATemperatureSensor(CoordinatorEntity, SensorEntity):
         if data is None:
             return attr
 
-        if data[0] is not None:
-            attr["temperature"] = data[0].water_temp[0]
-            attr["temperature_time"] = data[0].index[0].strftime("%Y-%m-%dT%H:%M")
-        if data[1] is not None:
-            attr["air_temperature"] = data[1].air_temp[0]
-            attr["air_temperature_time"] = data[1].index[0].strftime("%Y-%m-%dT%H:%M")
+        if data.water_temp is not None:
+            attr["temperature"], attr["temperature_time"] = data.water_temp
+        if data.air_temp is not None:
+            attr["air_temperature"], attr["air_temperature_time"] = data.air_temp
         return attr
 
     @property
@@ -725,12 +881,12 @@ class NOAATemperatureSensor(CoordinatorEntity, SensorEntity):
         data = self.coordinator.data
         if data is None:
             return None
-        if data[0] is None:
+        if data.water_temp is None:
             # If there is no water temperature use the air temperature
-            if data[1] is not None:
-                return data[1].air_temp[0]
+            if data.air_temp is not None:
+                return data.air_temp[0]
             return None
-        return data[0].water_temp[0]
+        return data.water_temp[0]
 
 
 class NOAABuoySensor(CoordinatorEntity, SensorEntity):
@@ -782,24 +938,23 @@ class NOAABuoySensor(CoordinatorEntity, SensorEntity):
 
         data_time = datetime(data["YY"][1], data["MM"][1], data["DD"][1],
                 hour=data["hh"][1], minute=data["mm"][1], tzinfo=tz.utc)
+        # Every reading shares the observation time, so format it only once
+        if self._timezone == "gmt":
+            data_time_str = _fmt(data_time, _FMT_ISO)
+        else:
+            data_time_str = _fmt(data_time.astimezone(tz=None), _FMT_ISO)
+
         for k in data:
-            if k in ("YY", "MM", "DD", "hh", "mm"):
+            if k in _BUOY_TIME_FIELDS:
                 continue
             if data[k][1] == "MM":
                 # continue here lets us retain the old values when there are no data availabile
                 continue
 
-            if self._timezone == "gmt":
-                attr[k + "_time"] = data_time.strftime("%Y-%m-%dT%H:%M")
-            else:
-                attr[k + "_time"] = data_time.replace(tzinfo=tz.utc).astimezone(tz=None).strftime("%Y-%m-%dT%H:%M")
-
-            if self._unit_system == "english" and data[k][0] == "degC":
-                attr[k + "_unit"] = "degF"
-                attr[k] = round((data[k][1] * 9 / 5) + 32, 1)
-            else:
-                attr[k + "_unit"] = data[k][0]
-                attr[k] = data[k][1]
+            attr[k + "_time"] = data_time_str
+            # The coordinator has already converted temperatures to the unit system
+            attr[k + "_unit"] = data[k][0]
+            attr[k] = data[k][1]
 
         return attr
 
@@ -813,6 +968,4 @@ class NOAABuoySensor(CoordinatorEntity, SensorEntity):
             return None
         if data["WTMP"][1] == "MM":
             return None
-        if self._unit_system == "metric":
-            return data["WTMP"][1]
-        return round((data["WTMP"][1] * 9 / 5) + 32, 1)
+        return data["WTMP"][1]
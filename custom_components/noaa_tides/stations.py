@@ -1,21 +1,143 @@
-"""NOAA and NDBC station metadata management."""
+"""NOAA and NDBC station metadata management.
+
+All requests go through Home Assistant's shared aiohttp session, so the
+station list download and station validation reuse pooled keep-alive
+connections instead of opening a new TLS connection per call. Downloaded
+station lists are also persisted with Home Assistant's storage helper and
+reused across restarts.
+"""
 from __future__ import annotations
 
+import asyncio
+from functools import partial
 import logging
-from typing import Any
+import re
+import time
+from typing import Any, NamedTuple, Optional
+
+import aiohttp
+import orjson
+
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
 
-import requests
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
 # NOAA Tides and Currents Metadata API
 NOAA_STATIONS_URL = "https://api.tidesandcurrents.noaa.gov/mdapi/prod/webapi/stations.json"
+NOAA_STATION_URL = "https://api.tidesandcurrents.noaa.gov/mdapi/prod/webapi/stations/{station_id}.json"
+
+# NDBC buoy IDs are 5 to 7 letters and digits (e.g. 44017, KIKT2)
+_BUOY_RE = re.compile(r"^[A-Za-z0-9]{5,7}$")
+
+# How long a downloaded station list is reused before fetching it again (seconds)
+STATION_CACHE_TTL = 86400
+# How long a failed download is remembered, so retries don't hammer NOAA (seconds)
+STATION_CACHE_FAILURE_TTL = 60
+
+# A station as cached: (id, name, state). These are the only fields the
+# config flow reads; everything else NOAA sends (coordinates, flags, links,
+# ...) is dropped before caching
+Station = tuple[str, str, Optional[str]]
+
+# Station lists are persisted so a restart doesn't have to download them again
+STORAGE_KEY = f"{DOMAIN}_stations"
+STORAGE_VERSION = 1
+# Delay before writing the station lists, so back-to-back refreshes share a write (seconds)
+STORAGE_SAVE_DELAY = 10
+
+
+class StationCacheEntry(NamedTuple):
+    """A downloaded station list and the lookups derived from it."""
+
+    fetched_at: float
+    expires_at: float
+    stations: list[Station]
+    stations_by_id: dict[str, Station]
+    stations_by_state: dict[str, list[Station]]
+    station_options_by_state: dict[str, dict[str, str]]
+    states: tuple[str, ...]
+
+
+def _build_cache_entry(
+    stations: list[Station], fetched_at: float, expires_at: float
+) -> StationCacheEntry:
+    """Build a cache entry and its lookups from a station list.
 
-# Cache for station data to avoid repeated API calls
-_station_cache: dict[str, Any] = {}
+    fetched_at is wall-clock time, so it can be persisted; expires_at is on
+    the monotonic clock.
+    """
+    states, stations_by_state, options_by_state = build_station_view(stations)
+    return StationCacheEntry(
+        fetched_at=fetched_at,
+        expires_at=expires_at,
+        stations=stations,
+        stations_by_id={station[0]: station for station in stations},
+        stations_by_state=stations_by_state,
+        station_options_by_state=options_by_state,
+        states=states,
+    )
+
+
+def _get_station_cache(hass) -> dict[str, StationCacheEntry]:
+    """Return the station cache shared by all config flows, keyed by station type."""
+    return hass.data.setdefault(DOMAIN, {}).setdefault("_stations_cache", {})
+
+
+def _get_inflight_refreshes(hass) -> dict[str, asyncio.Task]:
+    """Return the station list downloads currently running, keyed by station type."""
+    return hass.data.setdefault(DOMAIN, {}).setdefault("_stations_inflight", {})
+
+
+def _get_station_store(hass) -> Store:
+    """Return the store the station cache is persisted to."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "_stations_store" not in domain_data:
+        domain_data["_stations_store"] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+    return domain_data["_stations_store"]
+
+
+async def _async_load_station_cache(hass) -> None:
+    """Fill the station cache from disk, once per Home Assistant run."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if domain_data.get("_stations_loaded"):
+        return
+    stored = await _get_station_store(hass).async_load()
+    domain_data["_stations_loaded"] = True
+    if not stored:
+        return
+
+    cache = _get_station_cache(hass)
+    wall_now = time.time()
+    monotonic_now = time.monotonic()
+    for station_type, saved in stored.items():
+        # Carry over the remaining lifetime; an old snapshot loads already expired.
+        # Clamped at zero so a clock set backwards can't stretch it past the TTL
+        age = max(0.0, wall_now - saved["fetched_at"])
+        # JSON has no tuples, so stations come back as lists
+        stations = [tuple(station) for station in saved["stations"] if isinstance(station, list)]
+        if not stations:
+            continue
+        cache.setdefault(
+            station_type,
+            _build_cache_entry(
+                stations, saved["fetched_at"], monotonic_now + STATION_CACHE_TTL - age
+            ),
+        )
 
 
-async def fetch_noaa_stations(hass, station_type: str = "tidepredictions") -> list[dict[str, Any]]:
+def _station_cache_to_store(hass) -> dict[str, dict[str, Any]]:
+    """Return the successfully downloaded station lists in their stored form."""
+    return {
+        station_type: {"fetched_at": entry.fetched_at, "stations": entry.stations}
+        for station_type, entry in _get_station_cache(hass).items()
+        if entry.stations
+    }
+
+
+async def fetch_noaa_stations(hass, station_type: str = "tidepredictions") -> list[Station]:
     """Fetch station metadata from NOAA API.
     
     Args:
@@ -23,84 +145,244 @@ async def fetch_noaa_stations(hass, station_type: str = "tidepredictions") -> li
         station_type: Type of stations to fetch (tidepredictions, waterlevels, etc.)
     
     Returns:
-        List of station dictionaries with id, name, state, etc.
+        List of (id, name, state) station tuples
     """
-    cache_key = f"noaa_{station_type}"
+    cache = _get_station_cache(hass)
+    if station_type not in cache:
+        await _async_load_station_cache(hass)
+    cached = cache.get(station_type)
+    
+    if cached is not None and time.monotonic() < cached.expires_at:
+        return cached.stations
     
-    if cache_key in _station_cache:
-        return _station_cache[cache_key]
+    # Concurrent callers share one download instead of each starting their own
+    inflight = _get_inflight_refreshes(hass)
+    refresh = inflight.get(station_type)
+    if refresh is None:
+        # Untracked, so a background refresh never holds up Home Assistant
+        # startup; the in-flight dict keeps the reference until it finishes
+        refresh = hass.loop.create_task(_refresh_station_cache(hass, station_type))
+        inflight[station_type] = refresh
+        refresh.add_done_callback(lambda _: inflight.pop(station_type, None))
+
+    if cached is not None and cached.stations:
+        # Serve the expired list now; the refresh replaces it in the background
+        return cached.stations
+    # Shielded so a cancelled caller doesn't cancel the download for the others
+    return await asyncio.shield(refresh)
+
+
+def async_schedule_station_prewarm(hass) -> None:
+    """Start loading the tide and water level station lists in the background.
     
+    Only runs once per Home Assistant run, however many entries are set up.
+    The task is not tracked by Home Assistant, so startup doesn't wait on
+    the downloads.
+    
+    Args:
+        hass: Home Assistant instance
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if domain_data.get("_stations_prewarmed"):
+        return
+    domain_data["_stations_prewarmed"] = True
+    # Hold a reference until the task finishes so it can't be garbage collected
+    prewarm = hass.loop.create_task(_async_prewarm_station_cache(hass))
+    domain_data["_stations_prewarm"] = prewarm
+    prewarm.add_done_callback(lambda _: domain_data.pop("_stations_prewarm", None))
+
+
+async def _async_prewarm_station_cache(hass) -> None:
+    """Load the tide and water level station lists ahead of the config flow."""
+    # fetch_noaa_stations logs and caches its own failures
+    await asyncio.gather(
+        fetch_noaa_stations(hass, "tidepredictions"),
+        fetch_noaa_stations(hass, "waterlevels"),
+    )
+
+
+async def _refresh_station_cache(hass, station_type: str) -> list[Station]:
+    """Download a station list and store it, or the failure, in the cache."""
+    cache = _get_station_cache(hass)
+    cached = cache.get(station_type)
+    stations = await _download_stations(hass, station_type)
+    if stations is None:
+        # Cache the failure briefly so repeated lookups return at once,
+        # keeping an expired list if there is one rather than losing it
+        expires_at = time.monotonic() + STATION_CACHE_FAILURE_TTL
+        if cached is not None:
+            cache[station_type] = cached._replace(expires_at=expires_at)
+            return cached.stations
+        cache[station_type] = _build_cache_entry([], time.time(), expires_at)
+        return []
+
+    cache[station_type] = _build_cache_entry(
+        stations, time.time(), time.monotonic() + STATION_CACHE_TTL
+    )
+    _get_station_store(hass).async_delay_save(
+        partial(_station_cache_to_store, hass), STORAGE_SAVE_DELAY
+    )
+    return stations
+
+
+async def _download_stations(hass, station_type: str) -> list[Station] | None:
+    """Download the station list from the NOAA API, or return None on failure."""
+    session = async_get_clientsession(hass)
     try:
-        response = await hass.async_add_executor_job(
-            lambda: requests.get(
-                NOAA_STATIONS_URL,
-                params={"type": station_type},
-                timeout=10
-            )
-        )
-        
-        if response.status_code == 200:
-            data = response.json()
-            stations = data.get("stations", [])
-            _station_cache[cache_key] = stations
-            return stations
-        else:
-            _LOGGER.error("Failed to fetch NOAA stations: HTTP %s", response.status_code)
-            return []
-    except Exception as err:
+        async with session.get(
+            NOAA_STATIONS_URL,
+            params={"type": station_type},
+            timeout=aiohttp.ClientTimeout(total=10),
+        ) as response:
+            if response.status != 200:
+                _LOGGER.error("Failed to fetch NOAA stations: HTTP %s", response.status)
+                return None
+            # Parse the raw bytes with orjson, which Home Assistant ships
+            data = orjson.loads(await response.read())
+        return [
+            (station["id"], station.get("name") or "Unknown", station.get("state"))
+            for station in data.get("stations", [])
+            if station.get("id")
+        ]
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as err:
         _LOGGER.error("Error fetching NOAA stations: %s", err)
-        return []
+        return None
+    except (AttributeError, TypeError) as err:
+        # The payload parsed but isn't the expected {"stations": [{...}]} shape
+        _LOGGER.error("Unexpected NOAA stations response: %s", err)
+        return None
 
 
-def get_states_from_stations(stations: list[dict[str, Any]]) -> list[str]:
-    """Extract unique states from station list, sorted alphabetically.
+async def fetch_noaa_states(hass, station_type: str = "tidepredictions") -> tuple[str, ...]:
+    """Fetch the sorted list of states that have stations of the given type.
     
     Args:
-        stations: List of station dictionaries
+        hass: Home Assistant instance
+        station_type: Type of stations to fetch (tidepredictions, waterlevels, etc.)
     
     Returns:
-        Sorted list of unique state names
+        Sorted tuple of unique state names, computed once per cached station list
     """
-    states = set()
-    for station in stations:
-        state = station.get("state")
-        if state:
-            states.add(state)
-    return sorted(states)
+    await fetch_noaa_stations(hass, station_type)
+    cached = _get_station_cache(hass).get(station_type)
+    return cached.states if cached is not None else ()
+
+
+def get_cached_station_index(hass, station_type: str) -> dict[str, Station]:
+    """Return the cached stations of the given type keyed by station ID.
+    
+    Never starts a download; an expired list is still returned, since station
+    IDs don't go away between refreshes.
+    
+    Args:
+        hass: Home Assistant instance
+        station_type: Type of stations to look up (tidepredictions, waterlevels, etc.)
+    
+    Returns:
+        Dict mapping station ID to station, or an empty dict if nothing is cached
+    """
+    cached = _get_station_cache(hass).get(station_type)
+    return cached.stations_by_id if cached is not None else {}
 
 
-def filter_stations_by_state(stations: list[dict[str, Any]], state: str) -> list[dict[str, Any]]:
-    """Filter stations by state.
+async def get_station_index(hass, station_type: str) -> dict[str, Station]:
+    """Fetch the stations of the given type keyed by station ID.
     
     Args:
-        stations: List of station dictionaries
+        hass: Home Assistant instance
+        station_type: Type of stations to fetch (tidepredictions, waterlevels, etc.)
+    
+    Returns:
+        Dict mapping station ID to station, built once per cached station list
+    """
+    await fetch_noaa_stations(hass, station_type)
+    cached = _get_station_cache(hass).get(station_type)
+    return cached.stations_by_id if cached is not None else {}
+
+
+async def fetch_noaa_stations_in_state(
+    hass, station_type: str, state: str
+) -> list[Station]:
+    """Fetch the stations of the given type located in a state.
+    
+    Args:
+        hass: Home Assistant instance
+        station_type: Type of stations to fetch (tidepredictions, waterlevels, etc.)
         state: State to filter by
     
     Returns:
-        List of stations in the specified state
+        List of stations in the specified state, looked up from the cached grouping
     """
-    return [s for s in stations if s.get("state") == state]
+    await fetch_noaa_stations(hass, station_type)
+    cached = _get_station_cache(hass).get(station_type)
+    if cached is None:
+        return []
+    return cached.stations_by_state.get(state, [])
 
 
-def get_station_options(stations: list[dict[str, Any]]) -> dict[str, str]:
-    """Convert station list to options dict for selector.
+async def fetch_noaa_station_options(
+    hass, station_type: str, state: str
+) -> dict[str, str]:
+    """Fetch the selector options for the stations of the given type in a state.
     
     Args:
-        stations: List of station dictionaries
+        hass: Home Assistant instance
+        station_type: Type of stations to fetch (tidepredictions, waterlevels, etc.)
+        state: State to filter by
     
     Returns:
         Dict mapping station_id to display name (name - id), sorted alpha-numerically
+        and built once per cached station list
+    """
+    await fetch_noaa_stations(hass, station_type)
+    cached = _get_station_cache(hass).get(station_type)
+    if cached is None:
+        return {}
+    return cached.station_options_by_state.get(state, {})
+
+
+def build_station_view(
+    stations: list[Station],
+) -> tuple[tuple[str, ...], dict[str, list[Station]], dict[str, dict[str, str]]]:
+    """Build the state and station lookups the config flow needs in one pass.
+    
+    Args:
+        stations: List of (id, name, state) station tuples
+    
+    Returns:
+        Tuple of (sorted states, stations grouped by state, selector options by
+        state). Options map station_id to display name (name - id) and are sorted
+        alpha-numerically; stations without a state are left out
     """
-    options = {}
+    stations_by_state: dict[str, list[Station]] = {}
+    options_by_state: dict[str, dict[str, str]] = {}
     for station in stations:
-        station_id = station.get("id")
-        station_name = station.get("name", "Unknown")
-        if station_id:
-            options[station_id] = f"{station_name} ({station_id})"
+        station_id, station_name, state = station
+        if not state:
+            continue
+        stations_by_state.setdefault(state, []).append(station)
+        options_by_state.setdefault(state, {})[station_id] = f"{station_name} ({station_id})"
+
+    # Sort each state's options by display name (station name and ID) alpha-numerically
+    for state, options in options_by_state.items():
+        options_by_state[state] = dict(sorted(options.items(), key=lambda x: x[1].lower()))
+    return tuple(sorted(stations_by_state)), stations_by_state, options_by_state
+
+
+def verify_buoy_id(station_id: str) -> tuple[bool, str]:
+    """Verify that a buoy ID is well formed, without any network request.
+    
+    Args:
+        station_id: NDBC buoy ID to verify
     
-    # Sort by display name (station name and ID) alpha-numerically
-    sorted_options = dict(sorted(options.items(), key=lambda x: x[1].lower()))
-    return sorted_options
+    Returns:
+        Tuple of (is_valid, station_name or error_message)
+    """
+    # NDBC buoy IDs are typically 5 characters (alphanumeric)
+    # Common formats: 5-digit numbers (e.g., 44017) or 5-char alphanumeric (e.g., KIKT2)
+    if _BUOY_RE.match(station_id):
+        return True, f"Buoy {station_id}"
+    return False, "Invalid buoy ID format (must be 5 to 7 alphanumeric characters)"
 
 
 async def verify_station_id(hass, station_id: str, station_type: str) -> tuple[bool, str]:
@@ -115,31 +397,20 @@ async def verify_station_id(hass, station_id: str, station_type: str) -> tuple[b
         Tuple of (is_valid, station_name or error_message)
     """
     if station_type == "buoy":
-        # For buoy, we'll do a simpler validation
-        # NDBC buoy IDs are typically 5 characters (alphanumeric)
-        # Common formats: 5-digit numbers (e.g., 44017) or 5-char alphanumeric (e.g., 41001)
-        if len(station_id) >= 5 and station_id.isalnum():
-            return True, f"Buoy {station_id}"
-        else:
-            return False, "Invalid buoy ID format (must be at least 5 alphanumeric characters)"
+        return verify_buoy_id(station_id)
     
     # For NOAA stations (tides/temp), fetch and check
     try:
-        # First check our cache
-        stations = await fetch_noaa_stations(hass, "tidepredictions")
-        
-        # Look for exact match
-        for station in stations:
-            if station.get("id") == station_id:
-                station_name = station.get("name", "Unknown Station")
-                return True, station_name
+        # Load both lists concurrently; either may already be cached
+        tide_index, level_index = await asyncio.gather(
+            get_station_index(hass, "tidepredictions"),
+            get_station_index(hass, "waterlevels"),
+        )
         
-        # If not found in tide predictions, also check water levels
-        stations = await fetch_noaa_stations(hass, "waterlevels")
-        for station in stations:
-            if station.get("id") == station_id:
-                station_name = station.get("name", "Unknown Station")
-                return True, station_name
+        # Look for exact match, preferring the tide predictions list
+        station = tide_index.get(station_id) or level_index.get(station_id)
+        if station is not None:
+            return True, station[1]
         
         return False, f"Station ID {station_id} not found"
     except Exception as err: